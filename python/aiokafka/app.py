@@ -22,15 +22,36 @@ The app will produce and consume messages from a Kafka topic using async pattern
 """
 
 import asyncio
+import concurrent.futures
 import json
 import logging
 import time
 
-from aiokafka import AIOKafkaConsumer, AIOKafkaProducer
+from aiokafka import AIOKafkaClient, AIOKafkaConsumer, AIOKafkaProducer
 from aiokafka.errors import KafkaError, KafkaTimeoutError
 
 from opentelemetry.instrumentation.kafka import KafkaInstrumentor
 
+try:
+    import orjson
+
+    # orjson works on bytes directly, so no extra encode/decode per message
+    dumps_value = orjson.dumps
+    loads_value = orjson.loads
+except ImportError:
+
+    def dumps_value(value):
+        return json.dumps(value).encode("utf-8")
+
+    def loads_value(data):
+        return json.loads(data.decode("utf-8"))
+
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Instrument kafka (this also works for aiokafka)
 KafkaInstrumentor().instrument()
 
@@ -42,12 +63,36 @@ logger = logging.getLogger(__name__)
 KAFKA_BOOTSTRAP_SERVERS = ["localhost:9093"]
 TOPIC_NAME = "aiokafka-test-topic"
 
+# Startup probe: exponential backoff between attempts, bounded by an overall deadline
+KAFKA_WAIT_TIMEOUT = 60  # seconds
+KAFKA_PROBE_TIMEOUT = 2  # seconds per attempt
+KAFKA_RETRY_BASE_DELAY = 0.25  # seconds
+KAFKA_RETRY_MAX_DELAY = 10  # seconds
+
+# Messages are produced in bursts so the producer has enough records to batch;
+# deliveries are awaited once per burst instead of per send
+BURST_SIZE = 100
+BURST_INTERVAL = 2  # seconds between bursts
+
+# Consumer batching: records fetched per getmany() call and how long to wait for them
+CONSUME_MAX_RECORDS = 500
+CONSUME_TIMEOUT_MS = 500
+
+# Worker threads for message processing, so the consumer loop keeps fetching meanwhile
+PROCESS_WORKERS = 8
+
+# Message templates, formatted per record instead of building f-strings
+KEY_FORMAT = b"key-%d"
+MESSAGE_FORMAT = "Hello from aiokafka producer - message %d"
+
 
 class AioKafkaApp:
     def __init__(self):
         self.producer = None
         self.consumer = None
         self.running = False
+        self.tasks = []
+        self.pool = concurrent.futures.ThreadPoolExecutor(max_workers=PROCESS_WORKERS)
 
     async def create_producer(self):
         """Create aiokafka producer."""
@@ -55,9 +100,11 @@ class AioKafkaApp:
             self.producer = AIOKafkaProducer(
                 bootstrap_servers=KAFKA_BOOTSTRAP_SERVERS,
                 client_id="aiokafka-producer",
-                value_serializer=lambda v: json.dumps(v).encode("utf-8"),
-                key_serializer=lambda k: k.encode("utf-8") if k else None,
-                acks="all",  # Wait for all replicas to acknowledge
+                value_serializer=dumps_value,
+                acks=1,  # Leader acknowledgement is enough for this demo stream
+                linger_ms=100,  # Wait up to 100ms so records coalesce into one request
+                max_batch_size=200_000,  # Bytes per partition batch
+                compression_type="lz4",  # Compress whole batches on the wire
                 request_timeout_ms=30000,  # 30 seconds timeout
                 retry_backoff_ms=100,  # Backoff between retries
             )
@@ -78,7 +125,7 @@ class AioKafkaApp:
                 group_id="aiokafka-test-group",
                 auto_offset_reset="earliest",
                 enable_auto_commit=True,
-                value_deserializer=lambda m: json.loads(m.decode("utf-8")) if m else None,
+                value_deserializer=lambda m: loads_value(m) if m else None,
                 key_deserializer=lambda k: k.decode("utf-8") if k else None,
             )
             await self.consumer.start()
@@ -95,30 +142,56 @@ class AioKafkaApp:
             return
 
         message_count = 0
+        pending = []
+        # send() serializes the value before returning, so one dict is reused for every record
+        message = {"id": 0, "message": "", "timestamp": 0.0}
         while self.running:
             try:
-                message = {
-                    "id": message_count,
-                    "message": f"Hello from aiokafka producer - message {message_count}",
-                    "timestamp": time.time(),
-                }
-
-                # Produce message
-                try:
-                    await self.producer.send_and_wait(topic=TOPIC_NAME, key=f"key-{message_count}", value=message)
-                    logger.info(f"Produced message {message_count}: {message['message']}")
-                except KafkaTimeoutError:
-                    logger.error(f"Timeout producing message {message_count}")
-                except KafkaError as e:
-                    logger.error(f"Kafka error producing message {message_count}: {e}")
-
-                message_count += 1
-                await asyncio.sleep(2)  # Send a message every 2 seconds
+                for _ in range(BURST_SIZE):
+                    message["id"] = message_count
+                    message["message"] = MESSAGE_FORMAT % message_count
+                    message["timestamp"] = time.time()
+
+                    # Produce message without waiting for the broker, so sends can share a batch
+                    try:
+                        future = await self.producer.send(
+                            topic=TOPIC_NAME, key=KEY_FORMAT % message_count, value=message
+                        )
+                        pending.append((message_count, future))
+                    except KafkaTimeoutError:
+                        logger.error(f"Timeout producing message {message_count}")
+                    except KafkaError as e:
+                        logger.error(f"Kafka error producing message {message_count}: {e}")
+
+                    message_count += 1
+
+                # Wait for the whole burst to be delivered
+                await self.wait_for_deliveries(pending)
+                pending.clear()
+                logger.info(f"Produced {BURST_SIZE} messages (total {message_count})")
+
+                await asyncio.sleep(BURST_INTERVAL)
 
             except Exception as e:
                 logger.error(f"Unexpected error in producer: {e}")
                 await asyncio.sleep(1)
 
+        await self.wait_for_deliveries(pending)
+
+    async def wait_for_deliveries(self, pending):
+        """Wait for in-flight sends and log the result of each one."""
+        if not pending:
+            return
+
+        await asyncio.wait([future for _, future in pending])
+        for message_id, future in pending:
+            if future.cancelled():
+                logger.error(f"Send cancelled for message {message_id}")
+            elif future.exception() is not None:
+                logger.error(f"Kafka error producing message {message_id}: {future.exception()}")
+            elif logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Produced message {message_id}")
+
     async def consume_messages(self):
         """Consume messages from Kafka topic."""
         if not self.consumer:
@@ -128,32 +201,36 @@ class AioKafkaApp:
         logger.info(f"Starting to consume messages from topic: {TOPIC_NAME}")
 
         try:
-            async for message in self.consumer:
-                if not self.running:
-                    break
-
-                try:
-                    logger.info(
-                        f"Consumed message: key={message.key}, "
-                        f"value={message.value}, partition={message.partition}, "
-                        f"offset={message.offset}"
-                    )
-
-                    # Process the message
-                    await self.process_message(message.value)
-
-                except Exception as e:
-                    logger.error(f"Error processing message: {e}")
+            while self.running:
+                batch = await self.consumer.getmany(timeout_ms=CONSUME_TIMEOUT_MS, max_records=CONSUME_MAX_RECORDS)
+                for records in batch.values():
+                    await self.process_batch(records)
 
         except Exception as e:
             logger.error(f"Consumer error: {e}")
 
-    async def process_message(self, message):
-        """Process consumed message."""
+    async def process_batch(self, records):
+        """Process a batch of records fetched from one partition on the worker pool."""
+        loop = asyncio.get_running_loop()
+        futures = []
+        for message in records:
+            logger.info(
+                f"Consumed message: key={message.key}, "
+                f"value={message.value}, partition={message.partition}, "
+                f"offset={message.offset}"
+            )
+            futures.append(loop.run_in_executor(self.pool, self.process_message, message.value))
+
+        for result in await asyncio.gather(*futures, return_exceptions=True):
+            if isinstance(result, Exception):
+                logger.error(f"Error processing message: {result}")
+
+    def process_message(self, message):
+        """Process consumed message on a worker thread."""
         logger.info(f"Processing message: {message}")
         # Add your message processing logic here
-        # Simulate some async processing
-        await asyncio.sleep(0.1)
+        # Simulate some blocking processing
+        time.sleep(0.1)
 
     async def start(self):
         """Start the aiokafka application."""
@@ -172,11 +249,13 @@ class AioKafkaApp:
 
         # Start producer and consumer concurrently
         try:
-            producer_task = asyncio.create_task(self.produce_messages())
-            consumer_task = asyncio.create_task(self.consume_messages())
+            self.tasks = [
+                asyncio.create_task(self.produce_messages()),
+                asyncio.create_task(self.consume_messages()),
+            ]
 
-            # Wait for 30 seconds then stop
-            await asyncio.sleep(30)
+            # Run for 30 seconds, or until either task exits early
+            await asyncio.wait(self.tasks, timeout=30, return_when=asyncio.FIRST_COMPLETED)
 
         except KeyboardInterrupt:
             logger.info("Received interrupt signal, stopping...")
@@ -190,6 +269,12 @@ class AioKafkaApp:
         logger.info("Stopping aiokafka application...")
         self.running = False
 
+        # Cancel the producer/consumer tasks and wait for them before closing their clients
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.tasks = []
+
         # Stop producer and consumer
         if self.producer:
             try:
@@ -205,43 +290,42 @@ class AioKafkaApp:
             except Exception as e:
                 logger.error(f"Error stopping consumer: {e}")
 
+        self.pool.shutdown(wait=False)
+
         logger.info("Application stopped")
 
 
 async def wait_for_kafka():
     """Wait for Kafka to be available."""
     logger.info("Waiting for Kafka to be available...")
-    max_retries = 30
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + KAFKA_WAIT_TIMEOUT
+    delay = KAFKA_RETRY_BASE_DELAY
     retry_count = 0
 
-    while retry_count < max_retries:
-        test_producer = None
-        try:
-            # Try to create a simple producer to test connectivity
-            test_producer = AIOKafkaProducer(bootstrap_servers=KAFKA_BOOTSTRAP_SERVERS, client_id="connectivity-test")
-
-            await test_producer.start()
-
-            # Try to get cluster metadata to ensure connection is working
-            # Use the producer's client to check metadata
-            cluster = test_producer.client.cluster
-            if cluster.brokers():
-                logger.info("Kafka is available!")
-                return True
-            else:
-                raise Exception("No brokers found in cluster")
+    # One client is reused for every attempt instead of starting a producer per retry
+    client = AIOKafkaClient(bootstrap_servers=KAFKA_BOOTSTRAP_SERVERS, client_id="connectivity-test")
+    try:
+        while loop.time() < deadline:
+            try:
+                # Fetch cluster metadata to ensure the connection is working
+                await asyncio.wait_for(client.bootstrap(), timeout=KAFKA_PROBE_TIMEOUT)
+                if client.cluster.brokers():
+                    logger.info("Kafka is available!")
+                    return True
+                else:
+                    raise Exception("No brokers found in cluster")
 
-        except Exception as e:
-            retry_count += 1
-            logger.info(f"Kafka not ready (attempt {retry_count}/{max_retries}): {e}")
-            await asyncio.sleep(2)
-        finally:
-            # Ensure producer is properly closed
-            if test_producer is not None:
-                try:
-                    await test_producer.stop()
-                except Exception:
-                    pass  # Ignore errors during cleanup
+            except Exception as e:
+                retry_count += 1
+                logger.info(f"Kafka not ready (attempt {retry_count}, retrying in {delay:.1f}s): {e!r}")
+                await asyncio.sleep(delay)
+                delay = min(KAFKA_RETRY_MAX_DELAY, delay * 2)
+    finally:
+        try:
+            await client.close()
+        except Exception:
+            pass  # Ignore errors during cleanup
 
     logger.error("Kafka is not available after waiting")
     return False
@@ -267,4 +351,8 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Prefer the libuv-based loop when available; aiokafka works on it unchanged
+    if uvloop:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
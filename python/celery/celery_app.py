@@ -15,9 +15,12 @@ app.config_from_object(
     {
         "broker_url": "redis://localhost:6379/0",
         "result_backend": "redis://localhost:6379/0",
+        # JSON by default: msgpack only encodes integers up to 64 bits, and chain_example
+        # passes each step's (arbitrarily large) result to the next step as an argument.
+        # Tasks whose payloads are bounded opt into msgpack individually in tasks.py.
         "task_serializer": "json",
         "result_serializer": "json",
-        "accept_content": ["json"],
+        "accept_content": ["msgpack", "json"],
         "result_expires": 3600,
         "timezone": "UTC",
         "enable_utc": True,
@@ -5,11 +5,28 @@ Celery tasks definition.
 This module defines various Celery tasks for demonstration purposes.
 """
 
+import math
 import random
 import time
 
+import numpy as np
+from celery.signals import worker_process_init
 from celery_app import app
 
+# Upper bound on progress writes to the result backend per long_running_task
+PROGRESS_UPDATES = 10
+
+rng = np.random.default_rng()
+failure_rng = random.Random()
+
+
+@worker_process_init.connect
+def reseed_rng(**kwargs):
+    """Give each forked worker process its own random streams."""
+    global rng
+    rng = np.random.default_rng()
+    failure_rng.seed()
+
 
 @app.task
 def add_numbers(x, y):
@@ -34,18 +51,24 @@ def long_running_task(duration=10):
     Returns:
         dict: Status information about the completed task
     """
-    for i in range(duration):
-        time.sleep(1)
+    # Sleep in larger steps so long durations do not write progress every second
+    step = max(1, math.ceil(duration / PROGRESS_UPDATES))
+    done = 0
+    while done < duration:
+        chunk = min(step, duration - done)
+        time.sleep(chunk)
+        done += chunk
         # Update task state to show progress
         app.current_task.update_state(
             state="PROGRESS",
-            meta={"current": i + 1, "total": duration, "status": f"Processing step {i + 1}/{duration}"},
+            meta={"current": done, "total": duration, "status": f"Processing step {done}/{duration}"},
         )
 
     return {"status": "Task completed successfully!", "duration": duration, "result": f"Processed {duration} steps"}
 
 
-@app.task
+# Values are bounded to 1..1000, so the compact msgpack encoding can't overflow
+@app.task(serializer="msgpack")
 def generate_random_data(count=100):
     """
     Generate random data points.
@@ -56,10 +79,10 @@ def generate_random_data(count=100):
     Returns:
         list: List of random numbers
     """
-    return [random.randint(1, 1000) for _ in range(count)]
+    return rng.integers(1, 1001, size=count).tolist()
 
 
-@app.task
+@app.task(serializer="msgpack")
 def process_data(data):
     """
     Process a list of data (calculate statistics).
@@ -73,7 +96,20 @@ def process_data(data):
     if not data:
         return {"error": "No data provided"}
 
-    return {"count": len(data), "sum": sum(data), "average": sum(data) / len(data), "min": min(data), "max": max(data)}
+    # A chord callback receives one list per header task
+    if isinstance(data[0], list):
+        values = np.concatenate([np.asarray(part) for part in data])
+    else:
+        values = np.asarray(data)
+
+    total = values.sum().item()
+    return {
+        "count": values.size,
+        "sum": total,
+        "average": total / values.size,
+        "min": values.min().item(),
+        "max": values.max().item(),
+    }
 
 
 @app.task
@@ -95,7 +131,7 @@ def failing_task(self, fail_probability=0.7):
     Args:
         fail_probability: Probability of failure (0.0 to 1.0)
     """
-    if random.random() < fail_probability:
+    if failure_rng.random() < fail_probability:
         raise Exception(f"Task failed randomly (attempt {self.request.retries + 1})")
 
     return {
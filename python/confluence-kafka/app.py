@@ -20,11 +20,11 @@ To run:
 The app will produce and consume messages from a Kafka topic.
 """
 
-import json
 import logging
 import threading
 import time
 
+import msgpack
 from confluent_kafka import Consumer, KafkaError, KafkaException, Producer
 
 # Configure logging
@@ -35,19 +35,60 @@ logger = logging.getLogger(__name__)
 KAFKA_BOOTSTRAP_SERVERS = "localhost:9092"
 TOPIC_NAME = "test-topic"
 
+# Messages are produced in bursts so the producer has enough records to batch
+BURST_SIZE = 100
+BURST_INTERVAL = 2  # seconds between bursts
+
+# How long start() runs the producer/consumer before stopping
+RUN_DURATION = 30  # seconds
+
+# Maximum number of messages returned by one consume() call
+CONSUME_BATCH_SIZE = 500
+
+# Register a per-message delivery callback; off by default so successful deliveries never call into Python
+DEBUG_DELIVERY = False
+
+# Message templates, formatted per record instead of building f-strings
+KEY_FORMAT = b"key-%d"
+MESSAGE_FORMAT = "Hello from Confluent Kafka producer - message %d"
+
+# On-wire format: one schema version byte, then a msgpack array of (id, message, timestamp)
+MESSAGE_SCHEMA_VERSION = b"\x01"
+
+
+def encode_message(message_id, text, timestamp):
+    """Encode a message as a versioned msgpack record."""
+    return MESSAGE_SCHEMA_VERSION + msgpack.packb((message_id, text, timestamp))
+
+
+def decode_message(data):
+    """Decode a versioned msgpack record back into a message dict."""
+    if data[:1] != MESSAGE_SCHEMA_VERSION:
+        raise ValueError(f"Unsupported message schema version: {data[:1]!r}")
+    message_id, text, timestamp = msgpack.unpackb(memoryview(data)[1:])
+    return {"id": message_id, "message": text, "timestamp": timestamp}
+
 
 class ConfluentKafkaApp:
     def __init__(self):
         self.producer = None
         self.consumer = None
-        self.running = False
+        # Set by stop(); wakes the producer out of its wait between bursts immediately
+        self.stop_event = threading.Event()
         self.producer_thread = None
-        self.consumer_thread = None
 
     def create_producer(self):
         """Create Confluent Kafka producer."""
         try:
-            producer_config = {"bootstrap.servers": KAFKA_BOOTSTRAP_SERVERS, "client.id": "python-producer"}
+            producer_config = {
+                "bootstrap.servers": KAFKA_BOOTSTRAP_SERVERS,
+                "client.id": "python-producer",
+                "linger.ms": 50,  # Wait up to 50ms so records coalesce into one request
+                "batch.size": 64 * 1024,  # Bytes per partition batch
+                "compression.type": "lz4",  # Compress whole batches on the wire
+                "acks": 1,  # Leader acknowledgement is enough for this demo stream
+                "queue.buffering.max.messages": 100000,
+            }
             self.producer = Producer(producer_config)
             logger.info("Confluent Kafka producer created successfully")
             return True
@@ -63,6 +104,9 @@ class ConfluentKafkaApp:
                 "group.id": "test-group",
                 "auto.offset.reset": "earliest",
                 "client.id": "python-consumer",
+                "fetch.min.bytes": 65536,  # Let the broker accumulate data before answering a fetch
+                "fetch.wait.max.ms": 500,  # ...but never wait longer than this
+                "queued.min.messages": 100000,  # Prefetch deeper into each partition
             }
             self.consumer = Consumer(consumer_config)
             self.consumer.subscribe([TOPIC_NAME])
@@ -76,8 +120,8 @@ class ConfluentKafkaApp:
         """Delivery report callback for producer."""
         if err is not None:
             logger.error(f"Message delivery failed: {err}")
-        else:
-            logger.info(f"Message delivered to topic {msg.topic()} partition {msg.partition()} offset {msg.offset()}")
+        elif logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Message delivered to topic {msg.topic()} partition {msg.partition()} offset {msg.offset()}")
 
     def produce_messages(self):
         """Produce messages to Kafka topic."""
@@ -86,28 +130,25 @@ class ConfluentKafkaApp:
             return
 
         message_count = 0
-        while self.running:
+        callback = self.delivery_report if DEBUG_DELIVERY else None
+        while not self.stop_event.is_set():
             try:
-                message = {
-                    "id": message_count,
-                    "message": f"Hello from Confluent Kafka producer - message {message_count}",
-                    "timestamp": time.time(),
-                }
-
-                # Produce message
-                self.producer.produce(
-                    topic=TOPIC_NAME,
-                    key=f"key-{message_count}",
-                    value=json.dumps(message),
-                    callback=self.delivery_report,
-                )
-
-                # Trigger delivery report callbacks
+                for _ in range(BURST_SIZE):
+                    # Produce message
+                    self.producer.produce(
+                        topic=TOPIC_NAME,
+                        key=KEY_FORMAT % message_count,
+                        value=encode_message(message_count, MESSAGE_FORMAT % message_count, time.time()),
+                        callback=callback,
+                    )
+                    message_count += 1
+
+                # Trigger delivery report callbacks once per burst
                 self.producer.poll(0)
 
-                logger.info(f"Produced message {message_count}: {message}")
-                message_count += 1
-                time.sleep(2)  # Send a message every 2 seconds
+                logger.info(f"Produced {BURST_SIZE} messages (total {message_count})")
+                if self.stop_event.wait(BURST_INTERVAL):
+                    break
 
             except KafkaException as e:
                 logger.error(f"Kafka error producing message: {e}")
@@ -118,43 +159,43 @@ class ConfluentKafkaApp:
         logger.info("Flushing remaining messages...")
         self.producer.flush()
 
-    def consume_messages(self):
-        """Consume messages from Kafka topic."""
+    def consume_until(self, deadline):
+        """Consume messages from Kafka topic until the monotonic deadline passes."""
         if not self.consumer:
             logger.error("Consumer not initialized")
             return
 
         logger.info(f"Starting to consume messages from topic: {TOPIC_NAME}")
         try:
-            while self.running:
-                msg = self.consumer.poll(timeout=1.0)
-
-                if msg is None:
-                    continue
-
-                if msg.error():
-                    if msg.error().code() == KafkaError._PARTITION_EOF:
-                        # End of partition event
-                        logger.info(
-                            f"End of partition reached {msg.topic()} [{msg.partition()}] at offset {msg.offset()}"
-                        )
-                    elif msg.error():
+            while not self.stop_event.is_set() and time.monotonic() < deadline:
+                msgs = self.consumer.consume(num_messages=CONSUME_BATCH_SIZE, timeout=1.0)
+
+                for msg in msgs:
+                    if msg.error():
+                        if msg.error().code() == KafkaError._PARTITION_EOF:
+                            # End of partition event
+                            logger.info(
+                                f"End of partition reached {msg.topic()} [{msg.partition()}] at offset {msg.offset()}"
+                            )
+                            continue
                         logger.error(f"Consumer error: {msg.error()}")
-                        break
-                else:
+                        return
+
                     # Proper message
                     try:
-                        message_value = json.loads(msg.value().decode("utf-8"))
-                        logger.info(
-                            f"Consumed message: key={msg.key().decode('utf-8') if msg.key() else None}, "
-                            f"value={message_value}, partition={msg.partition()}, offset={msg.offset()}"
-                        )
+                        message_value = decode_message(msg.value())
+                        # Decode the key and format the line only when INFO logging is on
+                        if logger.isEnabledFor(logging.INFO):
+                            logger.info(
+                                f"Consumed message: key={msg.key().decode('utf-8') if msg.key() else None}, "
+                                f"value={message_value}, partition={msg.partition()}, offset={msg.offset()}"
+                            )
 
                         # Process the message
                         self.process_message(message_value)
 
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Failed to decode message JSON: {e}")
+                    except ValueError as e:
+                        logger.error(f"Failed to decode message: {e}")
                     except Exception as e:
                         logger.error(f"Error processing message: {e}")
 
@@ -186,18 +227,15 @@ class ConfluentKafkaApp:
             logger.error("Failed to initialize consumer")
             return
 
-        self.running = True
+        self.stop_event.clear()
 
-        # Start producer and consumer in separate threads
+        # Produce on a background thread and consume on this one
         try:
             self.producer_thread = threading.Thread(target=self.produce_messages)
-            self.consumer_thread = threading.Thread(target=self.consume_messages)
-
             self.producer_thread.start()
-            self.consumer_thread.start()
 
-            # Wait for a short time to let some messages be produced and consumed
-            time.sleep(30)  # Run for 30 seconds
+            # Consume for a short time to let some messages be produced and consumed
+            self.consume_until(deadline=time.monotonic() + RUN_DURATION)
 
         except KeyboardInterrupt:
             logger.info("Received interrupt signal, stopping...")
@@ -207,15 +245,12 @@ class ConfluentKafkaApp:
     def stop(self):
         """Stop the Kafka application."""
         logger.info("Stopping Confluent-Kafka application...")
-        self.running = False
+        self.stop_event.set()
 
-        # Wait for threads to finish
+        # Wait for the producer thread to finish
         if self.producer_thread and self.producer_thread.is_alive():
             self.producer_thread.join(timeout=5)
 
-        if self.consumer_thread and self.consumer_thread.is_alive():
-            self.consumer_thread.join(timeout=5)
-
         logger.info("Application stopped")
 
 
@@ -225,23 +260,24 @@ def wait_for_kafka():
     max_retries = 30
     retry_count = 0
 
-    while retry_count < max_retries:
-        try:
-            # Try to create a simple producer to test connectivity
-            test_config = {"bootstrap.servers": KAFKA_BOOTSTRAP_SERVERS, "client.id": "connectivity-test"}
-            test_producer = Producer(test_config)
-
-            # Get metadata to ensure connection is working
-            metadata = test_producer.list_topics(timeout=5)
-            test_producer.flush()
+    # One producer is reused for every attempt; librdkafka keeps reconnecting in the background
+    test_config = {"bootstrap.servers": KAFKA_BOOTSTRAP_SERVERS, "client.id": "connectivity-test"}
+    test_producer = Producer(test_config)
+    try:
+        while retry_count < max_retries:
+            try:
+                # Get metadata to ensure connection is working
+                test_producer.list_topics(timeout=5)
 
-            logger.info("Kafka is available!")
-            return True
+                logger.info("Kafka is available!")
+                return True
 
-        except Exception as e:
-            retry_count += 1
-            logger.info(f"Kafka not ready (attempt {retry_count}/{max_retries}): {e}")
-            time.sleep(2)
+            except Exception as e:
+                retry_count += 1
+                logger.info(f"Kafka not ready (attempt {retry_count}/{max_retries}): {e}")
+                time.sleep(2)
+    finally:
+        test_producer.flush()
 
     logger.error("Kafka is not available after waiting")
     return False
@@ -6,39 +6,60 @@ import django
 from django.conf import settings
 from django.core.management import execute_from_command_line
 
-# Initialize OpenTelemetry tracer
-from opentelemetry import trace
-from opentelemetry.sdk.trace.export import ConsoleSpanExporter
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
-from opentelemetry.sdk.resources import Resource
-from opentelemetry.semconv.resource import ResourceAttributes
-from opentelemetry.instrumentation.django import DjangoInstrumentor
+# Only the dev server produces spans; other management commands (shell,
+# makemigrations, ...) skip the OpenTelemetry imports and exporter thread
+RUNNING_SERVER = len(sys.argv) > 1 and sys.argv[1].startswith("runserver")
 
-# Configure resource with service information
-resource = Resource.create({
-    ResourceAttributes.SERVICE_NAME: "dev-django-sample",
-    ResourceAttributes.SERVICE_VERSION: "1.0.0",
-    ResourceAttributes.DEPLOYMENT_ENVIRONMENT: "development"
-})
 
-# Set up tracer provider only if not already configured
-if not hasattr(trace.get_tracer_provider(), '_real_tracer_provider'):
-    trace.set_tracer_provider(TracerProvider(resource=resource))
-    tracer_provider = trace.get_tracer_provider()
+def setup_tracing():
+    """Initialize the OpenTelemetry tracer provider."""
+    from opentelemetry import trace
+    from opentelemetry.sdk.trace.export import ConsoleSpanExporter
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.semconv.resource import ResourceAttributes
 
-    # Configure console span exporter
-    console_exporter = ConsoleSpanExporter()
+    # Configure resource with service information
+    resource = Resource.create({
+        ResourceAttributes.SERVICE_NAME: "dev-django-sample",
+        ResourceAttributes.SERVICE_VERSION: "1.0.0",
+        ResourceAttributes.DEPLOYMENT_ENVIRONMENT: "development"
+    })
 
-    # Add span processor
-    span_processor = BatchSpanProcessor(console_exporter)
-    tracer_provider.add_span_processor(span_processor)
+    # Set up tracer provider only if not already configured
+    if not hasattr(trace.get_tracer_provider(), '_real_tracer_provider'):
+        trace.set_tracer_provider(TracerProvider(resource=resource))
+        tracer_provider = trace.get_tracer_provider()
+
+        # Export over OTLP/gRPC by default; OTEL_TRACES_EXPORTER=console prints
+        # spans to stdout instead, which is much slower and only for local debugging
+        if os.environ.get("OTEL_TRACES_EXPORTER", "otlp") == "otlp":
+            from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+
+            exporter = OTLPSpanExporter(
+                endpoint=os.environ.get("OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4317"), insecure=True
+            )
+        else:
+            exporter = ConsoleSpanExporter()
+
+        # Add span processor; larger batches and a shorter delay keep the
+        # export queue from filling up under load
+        span_processor = BatchSpanProcessor(
+            exporter,
+            max_queue_size=16384,
+            schedule_delay_millis=500,
+            max_export_batch_size=2048,
+            export_timeout_millis=10000,
+        )
+        tracer_provider.add_span_processor(span_processor)
 
-# # Enable Django instrumentation after Django is set up
-# DjangoInstrumentor().instrument()
 
 def main():
     """Run administrative tasks."""
+    if RUNNING_SERVER:
+        setup_tracing()
+
     # Configure Django settings directly in code
     if not settings.configured:
         settings.configure(
@@ -62,9 +83,12 @@ def main():
             ROOT_URLCONF='urls',
         )
         django.setup()
-        
+
         # Enable Django instrumentation after Django is set up
-        DjangoInstrumentor().instrument()
+        if RUNNING_SERVER:
+            from opentelemetry.instrumentation.django import DjangoInstrumentor
+
+            DjangoInstrumentor().instrument()
     
     execute_from_command_line(sys.argv)
 
@@ -17,9 +17,29 @@ django.setup()
 # Set up OpenTelemetry
 code_attributes_processor = CodeAttributesSpanProcessor()
 
+# Export over OTLP/gRPC by default; OTEL_TRACES_EXPORTER=console prints spans to
+# stdout instead, which is much slower and only meant for local debugging
+if os.environ.get("OTEL_TRACES_EXPORTER", "otlp") == "otlp":
+    from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+
+    span_exporter = OTLPSpanExporter(
+        endpoint=os.environ.get("OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4317"), insecure=True
+    )
+else:
+    span_exporter = ConsoleSpanExporter()
+
 trace.set_tracer_provider(TracerProvider())
 trace.get_tracer_provider().add_span_processor(code_attributes_processor)
-trace.get_tracer_provider().add_span_processor(BatchSpanProcessor(ConsoleSpanExporter()))
+# Larger export batches and a shorter delay keep the queue from filling up under load
+trace.get_tracer_provider().add_span_processor(
+    BatchSpanProcessor(
+        span_exporter,
+        max_queue_size=16384,
+        schedule_delay_millis=500,
+        max_export_batch_size=2048,
+        export_timeout_millis=10000,
+    )
+)
 
 
 from amazon.opentelemetry.distro.patches._django_patches import _apply_django_instrumentation_patches
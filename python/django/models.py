@@ -20,6 +20,12 @@ class Book(models.Model):
         app_label = 'django_sample'
         db_table = "books"
         ordering = ['-created_at']
+        # Cover the common category/stock filter with the default ordering,
+        # plus lookups by author
+        indexes = [
+            models.Index(fields=['category', 'in_stock', '-created_at']),
+            models.Index(fields=['author']),
+        ]
 
 
 class Author(models.Model):
@@ -36,6 +42,7 @@ class Author(models.Model):
     class Meta:
         app_label = 'django_sample'
         db_table = "authors"
+        indexes = [models.Index(fields=['is_active'])]
 
 
 class Category(models.Model):
@@ -50,16 +57,38 @@ class Category(models.Model):
     class Meta:
         app_label = 'django_sample'
         db_table = "categories"
+        indexes = [models.Index(fields=['is_active'])]
+
+
+class Rating(models.IntegerChoices):
+    """Star rating for a review"""
+    ONE = 1
+    TWO = 2
+    THREE = 3
+    FOUR = 4
+    FIVE = 5
+
+
+class ReviewManager(models.Manager):
+    """Joins the book up front since Review.__str__ reads book.title.
+
+    Use Review._base_manager to query without the join.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().select_related("book")
 
 
 class Review(models.Model):
     """Review model for complex queries"""
     book = models.ForeignKey(Book, on_delete=models.CASCADE, related_name='reviews')
     reviewer_name = models.CharField(max_length=100)
-    rating = models.IntegerField(choices=[(i, i) for i in range(1, 6)])
+    rating = models.IntegerField(choices=Rating.choices)
     comment = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = ReviewManager()
+
     def __str__(self):
         return f"Review for {self.book.title} - {self.rating} stars"
 
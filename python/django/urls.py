@@ -9,6 +9,9 @@ router.register(r'api/test', TestViewSet, basename='test')
 router.register(r'api/products', ProductViewSet, basename='products')
 router.register(r'api/health', HealthViewSet, basename='health')
 
+# Build the router's URL patterns once at import time
+ROUTER_URLS = router.urls
+
 urlpatterns = [
     # Original function-based and class-based views
     path("", views.hello, name="hello"),  # Root path
@@ -23,7 +26,7 @@ urlpatterns = [
     path("orm/", views.orm_example_view, name="orm_example"),
     
     # DRF ViewSet routes (similar to pet clinic insurance service pattern)
-    path('', include(router.urls)),
+    path('', include(ROUTER_URLS)),
     # Alternative namespace pattern (commented for reference)
     # path('api/', include((router.urls, 'service'), namespace='service')),
 ]
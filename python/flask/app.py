@@ -5,7 +5,7 @@ Simple Flask application sample.
 This is a basic Flask app that demonstrates:
 - Basic routing
 - JSON responses
-- Template rendering
+- HTML responses
 - Static file serving
 
 To run:
@@ -14,16 +14,18 @@ To run:
 
 The app will be available at http://localhost:5000
 """
-import sys
-
 import requests
-
-sys.setrecursionlimit(5000)
-
-from flask import Flask, jsonify, render_template_string
+from requests.adapters import HTTPAdapter
+from flask import Flask, Response, jsonify
+from markupsafe import escape
 
 app = Flask(__name__)
 
+# Shared session so outbound calls reuse keep-alive connections; the pool is
+# sized for the gunicorn threads that share it
+session = requests.Session()
+session.mount("https://", HTTPAdapter(pool_connections=50, pool_maxsize=50, max_retries=1))
+
 # Simple HTML template
 HTML_TEMPLATE = """
 <!DOCTYPE html>
@@ -74,31 +76,30 @@ HTML_TEMPLATE = """
 </html>
 """
 
+# The page has no template variables, so encode it once instead of rendering per request
+HOME_PAGE_BODY = HTML_TEMPLATE.encode("utf-8")
+
+# Fixed parts of the personalized hello page; only the name is encoded per request
+HELLO_NAME_PREFIX = b"<h1>Hello, "
+HELLO_NAME_SUFFIX = '!</h1><p><a href="/">← Back to home</a></p>'.encode("utf-8")
+
 
 @app.route("/")
 def home():
     """Home page with links to all endpoints."""
-    return render_template_string(HTML_TEMPLATE)
+    return Response(HOME_PAGE_BODY, mimetype="text/html")
 
 
 @app.route("/hello")
 def hello():
-    _demo_client()
-
-    _demo_otel_span_decorator()
-
-    _demo_otel_span_api1()
-
-    _demo_otel_span_api2()
-
     """Simple hello endpoint."""
     return '<h1>Hello, Flask!</h1><p><a href="/">← Back to home</a></p>'
 
 
 def _demo_client():
-    """A demo function to illustrate recursion limit increase."""
+    """A demo function that makes an outbound HTTP call."""
 
-    requests.get("https://aws.amazon.com/")
+    session.get("https://aws.amazon.com/", timeout=5)
 
 
 from opentelemetry import trace
@@ -116,7 +117,7 @@ def _demo_otel_span_api1():
     """A demo function to illustrate OpenTelemetry span context manager."""
     with tracer.start_as_current_span("create-otel-span-by-api"):
 
-        requests.get("https://aws.amazon.com/")
+        session.get("https://aws.amazon.com/", timeout=5)
 
         pass
 
@@ -126,10 +127,21 @@ def _demo_otel_span_api2():
     span.end()
 
 
+def run_demos():
+    """Run the outbound call and OpenTelemetry span demos once at startup, off the request path."""
+    _demo_client()
+
+    _demo_otel_span_decorator()
+
+    _demo_otel_span_api1()
+
+    _demo_otel_span_api2()
+
+
 @app.route("/hello/<name>")
 def hello_name(name):
     """Personalized hello endpoint."""
-    return f'<h1>Hello, {name}!</h1><p><a href="/">← Back to home</a></p>'
+    return Response(HELLO_NAME_PREFIX + str(escape(name)).encode("utf-8") + HELLO_NAME_SUFFIX, mimetype="text/html")
 
 
 @app.route("/api/status")
@@ -159,4 +171,5 @@ def api_info():
 if __name__ == "__main__":
     print("Starting Simple Flask App...")
     print("Visit http://localhost:8000 to see the app")
+    run_demos()
     app.run(debug=True, host="0.0.0.0", port=8000)
@@ -0,0 +1,11 @@
+# Gunicorn configuration file
+import multiprocessing
+
+bind = "0.0.0.0:8000"
+# 2n+1 workers with 16 threads each, so requests blocked on outbound
+# HTTP calls don't hold up the rest of the worker
+workers = multiprocessing.cpu_count() * 2 + 1
+worker_class = "gthread"
+threads = 16
+timeout = 30
+keepalive = 2
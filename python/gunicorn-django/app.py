@@ -3,6 +3,9 @@ Django views for the gunicorn-django sample application.
 """
 from django.http import HttpResponse
 
+# Response body encoded once at import instead of per request
+HELLO_BODY = b"Hello World!"
+
 def hello_world(request):
     """Simple hello world view."""
-    return HttpResponse("Hello World!")
+    return HttpResponse(HELLO_BODY, content_type="text/plain; charset=utf-8")
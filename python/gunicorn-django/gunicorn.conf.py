@@ -1,7 +1,12 @@
 # Gunicorn configuration file
+import multiprocessing
+
 bind = "0.0.0.0:8000"
-workers = 2
-worker_class = "sync"
+# 2n+1 workers, each serving requests on a small thread pool so slow I/O
+# in one request does not block the whole worker
+workers = multiprocessing.cpu_count() * 2 + 1
+worker_class = "gthread"
+threads = 4  # Concurrent requests = workers * threads
 timeout = 30
 keepalive = 2
 max_requests = 1000
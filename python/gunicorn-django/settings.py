@@ -1,6 +1,10 @@
 # Django settings module
+from pathlib import Path
 
-DEBUG = True
+BASE_DIR = Path(__file__).resolve().parent
+
+# Debug mode records every SQL query and keeps extra per-request state; keep it off under gunicorn
+DEBUG = False
 SECRET_KEY = 'dev-secret-key-not-for-production'
 ALLOWED_HOSTS = ['*']
 
@@ -17,7 +21,14 @@ INSTALLED_APPS = [
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': ':memory:',
+        # A file database is shared by every gunicorn worker, unlike ':memory:'
+        # which gives each worker connection its own empty database. WAL lets
+        # readers proceed while a write is in progress (init_command needs Django 5.1+,
+        # pinned in requirements.txt).
+        'NAME': BASE_DIR / 'app.db',
+        'OPTIONS': {
+            'init_command': 'PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL;',
+        },
     }
 }
 
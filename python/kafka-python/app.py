@@ -20,11 +20,11 @@ To run:
 The app will produce and consume messages from a Kafka topic.
 """
 
-import json
 import logging
 import threading
 import time
 
+import orjson
 from kafka import KafkaConsumer, KafkaProducer
 from kafka.errors import KafkaError, KafkaTimeoutError
 
@@ -36,6 +36,19 @@ logger = logging.getLogger(__name__)
 KAFKA_BOOTSTRAP_SERVERS = ["localhost:9092"]
 TOPIC_NAME = "test-topic"
 
+# Messages are produced in bursts so the producer has enough records to batch
+BURST_SIZE = 100
+BURST_INTERVAL = 2  # seconds between bursts
+
+# Records returned by one consumer poll() call, and how long poll() may block
+CONSUME_MAX_RECORDS = 500
+CONSUME_TIMEOUT_MS = 500
+
+# Message templates, formatted per record instead of building f-strings; keys
+# are built as bytes directly so no key serializer is needed
+KEY_FORMAT = b"key-%d"
+MESSAGE_FORMAT = "Hello from kafka-python producer - message %d"
+
 
 class KafkaPythonApp:
     def __init__(self):
@@ -51,11 +64,13 @@ class KafkaPythonApp:
             self.producer = KafkaProducer(
                 bootstrap_servers=KAFKA_BOOTSTRAP_SERVERS,
                 client_id="python-producer",
-                value_serializer=lambda v: json.dumps(v).encode("utf-8"),
-                key_serializer=lambda k: k.encode("utf-8") if k else None,
+                value_serializer=orjson.dumps,  # Returns bytes directly
                 acks="all",  # Wait for all replicas to acknowledge
                 retries=3,
-                max_in_flight_requests_per_connection=1,
+                linger_ms=20,  # Wait up to 20ms so records coalesce into one request
+                batch_size=64 * 1024,  # Bytes per partition batch
+                compression_type="lz4",  # Compress whole batches on the wire
+                max_in_flight_requests_per_connection=5,
             )
             logger.info("kafka-python producer created successfully")
             return True
@@ -73,8 +88,7 @@ class KafkaPythonApp:
                 group_id="test-group",
                 auto_offset_reset="earliest",
                 enable_auto_commit=True,
-                value_deserializer=lambda m: json.loads(m.decode("utf-8")) if m else None,
-                key_deserializer=lambda k: k.decode("utf-8") if k else None,
+                # No deserializers: keys and values stay raw bytes and are decoded only where needed
             )
             logger.info("kafka-python consumer created successfully")
             return True
@@ -82,6 +96,18 @@ class KafkaPythonApp:
             logger.error(f"Failed to create kafka-python consumer: {e}")
             return False
 
+    def on_send_success(self, record_metadata):
+        """Delivery callback for successfully sent messages."""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Message delivered: topic={record_metadata.topic}, "
+                f"partition={record_metadata.partition}, offset={record_metadata.offset}"
+            )
+
+    def on_send_error(self, exc):
+        """Delivery callback for failed messages."""
+        logger.error(f"Message delivery failed: {exc}")
+
     def produce_messages(self):
         """Produce messages to Kafka topic."""
         if not self.producer:
@@ -89,29 +115,28 @@ class KafkaPythonApp:
             return
 
         message_count = 0
+        # send() serializes the value before returning, so one dict is reused for every record
+        message = {"id": 0, "message": "", "timestamp": 0.0}
         while self.running:
             try:
-                message = {
-                    "id": message_count,
-                    "message": f"Hello from kafka-python producer - message {message_count}",
-                    "timestamp": time.time(),
-                }
+                for _ in range(BURST_SIZE):
+                    message["id"] = message_count
+                    message["message"] = MESSAGE_FORMAT % message_count
+                    message["timestamp"] = time.time()
 
-                # Produce message
-                future = self.producer.send(topic=TOPIC_NAME, key=f"key-{message_count}", value=message)
+                    # Produce message; delivery is reported through callbacks instead of blocking per send
+                    future = self.producer.send(topic=TOPIC_NAME, key=KEY_FORMAT % message_count, value=message)
+                    future.add_callback(self.on_send_success).add_errback(self.on_send_error)
+                    message_count += 1
 
-                # Wait for the message to be sent
+                # Wait for the burst to be delivered
                 try:
-                    record_metadata = future.get(timeout=10)
-                    logger.info(
-                        f"Produced message {message_count}: topic={record_metadata.topic}, "
-                        f"partition={record_metadata.partition}, offset={record_metadata.offset}"
-                    )
+                    self.producer.flush(timeout=5)
+                    logger.info(f"Produced {BURST_SIZE} messages (total {message_count})")
                 except KafkaTimeoutError:
-                    logger.error(f"Timeout producing message {message_count}")
+                    logger.error(f"Timeout flushing messages (total {message_count})")
 
-                message_count += 1
-                time.sleep(2)  # Send a message every 2 seconds
+                time.sleep(BURST_INTERVAL)
 
             except KafkaError as e:
                 logger.error(f"Kafka error producing message: {e}")
@@ -134,31 +159,26 @@ class KafkaPythonApp:
         try:
             while self.running:
                 try:
-                    # Use a simple loop with timeout checking
-                    message = None
-                    start_time = time.time()
-                    timeout = 1.0  # 1 second timeout
-
-                    for msg in self.consumer:
-                        message = msg
-                        break
-
-                    if message:
-                        try:
-                            logger.info(
-                                f"Consumed message: key={message.key}, "
-                                f"value={message.value}, partition={message.partition}, "
-                                f"offset={message.offset}"
-                            )
-
-                            # Process the message
-                            self.process_message(message.value)
-
-                        except Exception as e:
-                            logger.error(f"Error processing message: {e}")
-                    else:
-                        # No message received, sleep briefly
-                        time.sleep(0.1)
+                    # Block in poll() until records arrive or the timeout passes
+                    batches = self.consumer.poll(timeout_ms=CONSUME_TIMEOUT_MS, max_records=CONSUME_MAX_RECORDS)
+
+                    for records in batches.values():
+                        for message in records:
+                            try:
+                                # Decode the key and format the line only when INFO logging is on
+                                if logger.isEnabledFor(logging.INFO):
+                                    key = message.key.decode("utf-8") if message.key else None
+                                    logger.info(
+                                        f"Consumed message: key={key}, "
+                                        f"value_bytes={len(message.value or b'')}, partition={message.partition}, "
+                                        f"offset={message.offset}"
+                                    )
+
+                                # Process the message
+                                self.process_message(message.value)
+
+                            except Exception as e:
+                                logger.error(f"Error processing message: {e}")
 
                 except Exception as e:
                     logger.error(f"Error in consumer loop: {e}")
@@ -172,9 +192,11 @@ class KafkaPythonApp:
                 self.consumer.close()
 
     def process_message(self, message):
-        """Process consumed message."""
-        logger.info(f"Processing message: {message}")
-        # Add your message processing logic here
+        """Process a consumed message value (raw bytes)."""
+        if logger.isEnabledFor(logging.INFO):
+            snippet = message.decode("utf-8", "replace")[:200] if message else None
+            logger.info(f"Processing message: {snippet}")
+        # Add your message processing logic here; decode with orjson.loads(message) when fields are needed
         pass
 
     def start(self):
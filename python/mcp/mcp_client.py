@@ -1,13 +1,47 @@
 import asyncio
+import time
 
+import httpx
 from mcp import ClientSession
 from mcp.client.streamable_http import streamablehttp_client
 
+# Number of add_numbers calls made over the one session, and how many may be in flight at once
+CALL_COUNT = 100
+MAX_CONCURRENT_CALLS = 32
+
+
+async def call_tool_limited(session, semaphore, name, arguments):
+    """Call a tool once a concurrency slot is free."""
+    async with semaphore:
+        return await session.call_tool(name, arguments)
+
+
+def create_http_client(headers=None, timeout=None, auth=None):
+    """httpx client for the MCP transport with HTTP/2 and a larger keep-alive pool.
+
+    HTTP/2 is negotiated for https endpoints; plain http stays on HTTP/1.1 keep-alive.
+    """
+    return httpx.AsyncClient(
+        headers=headers,
+        timeout=timeout if timeout is not None else httpx.Timeout(120),
+        auth=auth,
+        follow_redirects=True,
+        # With an explicit transport, HTTP/2 and pool limits are configured on the transport itself
+        transport=httpx.AsyncHTTPTransport(
+            retries=1,
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        ),
+    )
+
+
 async def main():
     mcp_url = "http://localhost:8000/mcp"
     headers = {}
 
-    async with streamablehttp_client(mcp_url, headers, timeout=120, terminate_on_close=False) as (
+    async with streamablehttp_client(
+        mcp_url, headers, timeout=120, terminate_on_close=False, httpx_client_factory=create_http_client
+    ) as (
         read_stream,
         write_stream,
         _,
@@ -28,5 +62,21 @@ async def main():
             except Exception as e:
                 print(f"Error calling add_numbers: {e}")
 
+            # Test 2: Reuse the same session and overlap many calls instead of awaiting each in turn
+            print(f"=== Test 2: {CALL_COUNT} concurrent add_numbers calls on one session ===")
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_CALLS)
+            start = time.perf_counter()
+            try:
+                await asyncio.gather(
+                    *(
+                        call_tool_limited(session, semaphore, "add_numbers", {"a": i, "b": i + 1})
+                        for i in range(CALL_COUNT)
+                    )
+                )
+                elapsed = time.perf_counter() - start
+                print(f"Completed {CALL_COUNT} calls in {elapsed:.2f}s")
+            except Exception as e:
+                print(f"Error calling add_numbers: {e}")
+
 if __name__ == "__main__":
     asyncio.run(main())
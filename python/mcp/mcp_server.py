@@ -1,10 +1,25 @@
+import os
+
 from opentelemetry import trace
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
 # Set up OpenTelemetry
 
+# Export over OTLP/gRPC by default; OTEL_TRACES_EXPORTER=console prints spans to
+# stdout instead, which is much slower and only meant for local debugging
+if os.environ.get("OTEL_TRACES_EXPORTER", "otlp") == "otlp":
+    from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+
+    span_exporter = OTLPSpanExporter(
+        endpoint=os.environ.get("OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4317"), insecure=True
+    )
+else:
+    span_exporter = ConsoleSpanExporter()
+
 trace.set_tracer_provider(TracerProvider())
-trace.get_tracer_provider().add_span_processor(BatchSpanProcessor(ConsoleSpanExporter()))
+trace.get_tracer_provider().add_span_processor(
+    BatchSpanProcessor(span_exporter, max_queue_size=4096, max_export_batch_size=512, schedule_delay_millis=5000)
+)
 
 
 from amazon.opentelemetry.distro.patches._starlette_patches import _apply_starlette_instrumentation_patches
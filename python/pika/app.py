@@ -14,8 +14,10 @@ To run:
 """
 
 import json
+import os
 import threading
 import time
+from collections import deque
 from datetime import datetime
 
 import pika
@@ -24,11 +26,35 @@ from pika.exceptions import AMQPChannelError, AMQPConnectionError
 
 app = Flask(__name__)
 
-# Global variables for RabbitMQ connection
+# Global variables for RabbitMQ connection. connection/channel serve the Flask
+# request threads; the consumer thread owns a separate connection of its own.
 connection = None
 channel = None
 consumer_thread = None
-received_messages = []
+consumer_connection = None
+consumer_channel = None
+received_messages = deque(maxlen=50)  # Keeps only the last 50 messages
+
+# received_messages is written by the consumer thread and read by request threads.
+# BlockingConnection is not thread-safe, so connection_lock is held for every use of
+# the shared request-side channel and guards the consumer globals. It is reentrant
+# because routes that hold it also call get_rabbitmq_connection().
+messages_lock = threading.Lock()
+connection_lock = threading.RLock()
+
+# Unacknowledged deliveries the broker may push to the consumer at once. Without a
+# limit RabbitMQ pushes the whole backlog into the client; 1 is safest but much slower
+PREFETCH_COUNT = int(os.environ.get("PREFETCH_COUNT", 100))
+
+# Deliveries are acknowledged together with multiple=True instead of one frame each
+# Kept below PREFETCH_COUNT, otherwise the broker stops delivering and each window waits for the timer
+ACK_BATCH_SIZE = max(1, min(50, PREFETCH_COUNT // 2))
+ACK_FLUSH_INTERVAL = 0.1  # seconds before a partial batch is acknowledged
+
+# Properties are immutable per publish, so one persistent-delivery instance is shared.
+# Publisher confirms are left off: BlockingChannel waits for each confirm inside
+# basic_publish, which would turn a batch of N messages into N round-trips.
+PERSISTENT_PROPERTIES = pika.BasicProperties(delivery_mode=pika.DeliveryMode.Persistent)
 
 # HTML template for the web interface
 HTML_TEMPLATE = """
@@ -180,56 +206,108 @@ HTML_TEMPLATE = """
 """
 
 
+def create_rabbitmq_connection():
+    """Open a new RabbitMQ connection."""
+    connection_params = pika.ConnectionParameters(
+        host="localhost", port=5672, heartbeat=600, blocked_connection_timeout=300
+    )
+    return pika.BlockingConnection(connection_params)
+
+
 def get_rabbitmq_connection():
-    """Get RabbitMQ connection."""
+    """Get the RabbitMQ connection shared by request threads; callers must hold connection_lock while using it."""
     global connection, channel
-    try:
-        if connection is None or connection.is_closed:
-            connection_params = pika.ConnectionParameters(
-                host="localhost", port=5672, heartbeat=600, blocked_connection_timeout=300
-            )
-            connection = pika.BlockingConnection(connection_params)
-            channel = connection.channel()
-        return connection, channel
-    except AMQPConnectionError as e:
-        return None, None
+    with connection_lock:
+        try:
+            if connection is None or connection.is_closed:
+                connection = create_rabbitmq_connection()
+                channel = connection.channel()
+            elif channel is None or channel.is_closed:
+                # e.g. a passive declare of a missing queue closes the channel
+                channel = connection.channel()
+            return connection, channel
+        except AMQPConnectionError as e:
+            return None, None
 
 
 def close_rabbitmq_connection():
     """Close RabbitMQ connection."""
     global connection, channel
-    if connection and not connection.is_closed:
-        connection.close()
-        connection = None
-        channel = None
+    with connection_lock:
+        if connection and not connection.is_closed:
+            connection.close()
+            connection = None
+            channel = None
+
 
+def stop_consumer_thread():
+    """Ask the consumer thread to stop; callers must hold connection_lock.
+
+    The consumer's connection belongs to its thread, so stop_consuming is
+    scheduled on that thread instead of being called from here.
+    """
+    global consumer_thread
+    if not (consumer_thread and consumer_thread.is_alive()):
+        return False
+    if consumer_connection and consumer_connection.is_open:
+        consumer_connection.add_callback_threadsafe(consumer_channel.stop_consuming)
+    consumer_thread = None
+    return True
 
-def consumer_worker(queue_name):
-    """Worker function for consuming messages."""
-    global received_messages
+
+def consumer_worker(conn, ch, queue_name):
+    """Worker function for consuming messages on the consumer's own connection."""
+    global consumer_connection, consumer_channel
     try:
-        conn, ch = get_rabbitmq_connection()
-        if not conn:
-            return
+        unacked = 0
+        last_delivery_tag = None
+
+        def ack_pending():
+            nonlocal unacked
+            if unacked:
+                ch.basic_ack(delivery_tag=last_delivery_tag, multiple=True)
+                unacked = 0
+
+        def flush_acks_periodically():
+            ack_pending()
+            # Keep the timer running only while the consumer is registered
+            if ch.consumer_tags:
+                conn.call_later(ACK_FLUSH_INTERVAL, flush_acks_periodically)
 
         def callback(ch, method, properties, body):
+            nonlocal unacked, last_delivery_tag
             message = {
                 "timestamp": datetime.now().strftime("%H:%M:%S"),
                 "queue": queue_name,
                 "body": body.decode("utf-8"),
                 "delivery_tag": method.delivery_tag,
             }
-            received_messages.append(message)
-            # Keep only the last 50 messages
-            if len(received_messages) > 50:
-                received_messages.pop(0)
-            ch.basic_ack(delivery_tag=method.delivery_tag)
-
+            with messages_lock:
+                received_messages.append(message)
+            last_delivery_tag = method.delivery_tag
+            unacked += 1
+            if unacked >= ACK_BATCH_SIZE:
+                ack_pending()
+
+        ch.basic_qos(prefetch_count=PREFETCH_COUNT, global_qos=False)
         ch.basic_consume(queue=queue_name, on_message_callback=callback)
-        ch.start_consuming()
+        conn.call_later(ACK_FLUSH_INTERVAL, flush_acks_periodically)
+        try:
+            ch.start_consuming()
+        finally:
+            # Acknowledge whatever is left so stopping does not redeliver processed messages
+            if ch.is_open:
+                ack_pending()
 
     except Exception as e:
         print(f"Consumer error: {e}")
+    finally:
+        with connection_lock:
+            if consumer_connection is conn:
+                consumer_connection = None
+                consumer_channel = None
+        if conn.is_open:
+            conn.close()
 
 
 @app.route("/")
@@ -262,15 +340,12 @@ def connect():
 @app.route("/disconnect", methods=["POST"])
 def disconnect():
     """Disconnect from RabbitMQ."""
-    global consumer_thread
     try:
-        # Stop consumer if running
-        if consumer_thread and consumer_thread.is_alive():
-            if channel:
-                channel.stop_consuming()
-            consumer_thread = None
+        with connection_lock:
+            # Stop consumer if running
+            stop_consumer_thread()
 
-        close_rabbitmq_connection()
+            close_rabbitmq_connection()
         return jsonify({"status": "success", "message": "Disconnected from RabbitMQ"})
     except Exception as e:
         return jsonify({"status": "error", "message": f"Disconnect error: {str(e)}"})
@@ -279,15 +354,16 @@ def disconnect():
 @app.route("/connection-status", methods=["POST"])
 def connection_status():
     """Check RabbitMQ connection status."""
-    global connection
     try:
-        if connection and not connection.is_closed:
+        with connection_lock:
+            conn = connection
+        if conn and not conn.is_closed:
             return jsonify(
                 {
                     "status": "success",
                     "connected": True,
                     "message": "Connected to RabbitMQ",
-                    "connection_info": {"is_open": connection.is_open, "host": "localhost", "port": 5672},
+                    "connection_info": {"is_open": conn.is_open, "host": "localhost", "port": 5672},
                 }
             )
         else:
@@ -303,11 +379,12 @@ def create_queue():
         data = request.json or {}
         queue_name = data.get("queue", "demo_queue")
 
-        conn, ch = get_rabbitmq_connection()
-        if not conn:
-            return jsonify({"status": "error", "message": "Not connected to RabbitMQ"})
+        with connection_lock:
+            conn, ch = get_rabbitmq_connection()
+            if not conn:
+                return jsonify({"status": "error", "message": "Not connected to RabbitMQ"})
 
-        ch.queue_declare(queue=queue_name, durable=True)
+            ch.queue_declare(queue=queue_name, durable=True)
         return jsonify(
             {"status": "success", "message": f'Queue "{queue_name}" created successfully', "queue": queue_name}
         )
@@ -322,11 +399,12 @@ def queue_info():
         data = request.json or {}
         queue_name = data.get("queue", "demo_queue")
 
-        conn, ch = get_rabbitmq_connection()
-        if not conn:
-            return jsonify({"status": "error", "message": "Not connected to RabbitMQ"})
+        with connection_lock:
+            conn, ch = get_rabbitmq_connection()
+            if not conn:
+                return jsonify({"status": "error", "message": "Not connected to RabbitMQ"})
 
-        method = ch.queue_declare(queue=queue_name, durable=True, passive=True)
+            method = ch.queue_declare(queue=queue_name, durable=True, passive=True)
         return jsonify(
             {
                 "status": "success",
@@ -347,20 +425,21 @@ def publish():
         queue_name = data.get("queue", "demo_queue")
         message = data.get("message", '{"hello": "world"}')
 
-        conn, ch = get_rabbitmq_connection()
-        if not conn:
-            return jsonify({"status": "error", "message": "Not connected to RabbitMQ"})
+        with connection_lock:
+            conn, ch = get_rabbitmq_connection()
+            if not conn:
+                return jsonify({"status": "error", "message": "Not connected to RabbitMQ"})
 
-        # Ensure queue exists
-        ch.queue_declare(queue=queue_name, durable=True)
+            # Ensure queue exists
+            ch.queue_declare(queue=queue_name, durable=True)
 
-        # Publish message
-        ch.basic_publish(
-            exchange="",
-            routing_key=queue_name,
-            body=message,
-            properties=pika.BasicProperties(delivery_mode=2),  # Make message persistent
-        )
+            # Publish message
+            ch.basic_publish(
+                exchange="",
+                routing_key=queue_name,
+                body=message,
+                properties=PERSISTENT_PROPERTIES,  # Make message persistent
+            )
 
         return jsonify(
             {
@@ -383,21 +462,20 @@ def publish_batch():
         queue_name = data.get("queue", "demo_queue")
         count = data.get("count", 5)
 
-        conn, ch = get_rabbitmq_connection()
-        if not conn:
-            return jsonify({"status": "error", "message": "Not connected to RabbitMQ"})
+        with connection_lock:
+            conn, ch = get_rabbitmq_connection()
+            if not conn:
+                return jsonify({"status": "error", "message": "Not connected to RabbitMQ"})
 
-        # Ensure queue exists
-        ch.queue_declare(queue=queue_name, durable=True)
+            # Ensure queue exists
+            ch.queue_declare(queue=queue_name, durable=True)
 
-        # Publish multiple messages
-        for i in range(count):
-            message = json.dumps(
-                {"id": i + 1, "message": f"Batch message {i + 1}", "timestamp": datetime.now().isoformat()}
-            )
-            ch.basic_publish(
-                exchange="", routing_key=queue_name, body=message, properties=pika.BasicProperties(delivery_mode=2)
-            )
+            # Publish multiple messages
+            for i in range(count):
+                message = json.dumps(
+                    {"id": i + 1, "message": f"Batch message {i + 1}", "timestamp": datetime.now().isoformat()}
+                )
+                ch.basic_publish(exchange="", routing_key=queue_name, body=message, properties=PERSISTENT_PROPERTIES)
 
         return jsonify(
             {
@@ -415,26 +493,33 @@ def publish_batch():
 @app.route("/start-consumer", methods=["POST"])
 def start_consumer():
     """Start consuming messages from a queue."""
-    global consumer_thread
+    global consumer_thread, consumer_connection, consumer_channel
     try:
         data = request.json or {}
         queue_name = data.get("queue", "demo_queue")
 
-        conn, ch = get_rabbitmq_connection()
-        if not conn:
+        # The consumer gets a dedicated connection that only its thread uses from here on
+        try:
+            conn = create_rabbitmq_connection()
+        except AMQPConnectionError:
             return jsonify({"status": "error", "message": "Not connected to RabbitMQ"})
+        try:
+            ch = conn.channel()
 
-        # Stop existing consumer if running
-        if consumer_thread and consumer_thread.is_alive():
-            if channel:
-                channel.stop_consuming()
+            # Ensure queue exists
+            ch.queue_declare(queue=queue_name, durable=True)
+        except Exception:
+            conn.close()
+            raise
 
-        # Ensure queue exists
-        ch.queue_declare(queue=queue_name, durable=True)
+        with connection_lock:
+            # Stop existing consumer if running
+            stop_consumer_thread()
 
-        # Start consumer in a separate thread
-        consumer_thread = threading.Thread(target=consumer_worker, args=(queue_name,), daemon=True)
-        consumer_thread.start()
+            # Start consumer in a separate thread
+            consumer_connection, consumer_channel = conn, ch
+            consumer_thread = threading.Thread(target=consumer_worker, args=(conn, ch, queue_name), daemon=True)
+            consumer_thread.start()
 
         return jsonify(
             {
@@ -451,12 +536,10 @@ def start_consumer():
 @app.route("/stop-consumer", methods=["POST"])
 def stop_consumer():
     """Stop the message consumer."""
-    global consumer_thread
     try:
-        if consumer_thread and consumer_thread.is_alive():
-            if channel:
-                channel.stop_consuming()
-            consumer_thread = None
+        with connection_lock:
+            running = stop_consumer_thread()
+        if running:
             return jsonify(
                 {"status": "success", "message": "Consumer stopped", "timestamp": datetime.now().strftime("%H:%M:%S")}
             )
@@ -469,17 +552,17 @@ def stop_consumer():
 @app.route("/messages", methods=["GET"])
 def get_messages():
     """Get received messages."""
-    global received_messages
-    return jsonify(
-        {"messages": received_messages[-20:], "total_count": len(received_messages)}  # Return last 20 messages
-    )
+    with messages_lock:
+        messages = list(received_messages)[-20:]  # Return last 20 messages
+        total_count = len(received_messages)
+    return jsonify({"messages": messages, "total_count": total_count})
 
 
 @app.route("/clear-messages", methods=["POST"])
 def clear_messages():
     """Clear received messages."""
-    global received_messages
-    received_messages.clear()
+    with messages_lock:
+        received_messages.clear()
     return jsonify({"status": "success", "message": "Messages cleared"})
 
 